@@ -21,6 +21,7 @@ Usage:
     python date_utils.py next-recurring 2026-01-10 "second saturday"  # Next 2nd Sat
     python date_utils.py next-recurring 2026-01-01 quarterly          # Add 3 months
     python date_utils.py next-recurring 2026-01-01 yearly             # Add 1 year
+    python date_utils.py batch                            # JSONL on stdin: {"date", "pattern"}
 
 All commands support --json flag for structured output.
 
@@ -29,15 +30,20 @@ Configuration:
     Default: America/Toronto (Eastern)
 """
 
-import argparse
+import calendar
 import json
 import os
 import sys
 from datetime import datetime, timedelta
+from functools import lru_cache
+from types import SimpleNamespace
 from zoneinfo import ZoneInfo
-from dateutil.relativedelta import relativedelta
 from typing import Optional
 
+# argparse is imported lazily in main()'s slow path: the fast-path
+# dispatcher builds a SimpleNamespace, so a plain `weekday` call (or an
+# importer like task_manager) never loads it
+
 # Configure your timezone here, or set LOCAL_TIMEZONE env var
 LOCAL_TZ = ZoneInfo(os.environ.get("LOCAL_TIMEZONE", "America/Toronto"))
 
@@ -48,30 +54,92 @@ WEEKDAYS = {
 
 WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 
+ORDINALS = {
+    'first': 1, 'second': 2, 'third': 3, 'fourth': 4, 'fifth': 5,
+    '1st': 1, '2nd': 2, '3rd': 3, '4th': 4, '5th': 5
+}
+
+# Every recognized recurring pattern, enumerated once at import so parsing
+# is a single dict lookup (see parse_recurring_pattern)
+PATTERN_TABLE = {
+    'weekly': ('weekly', None, None),
+    'monthly': ('monthly', None, None),
+    'quarterly': ('quarterly', None, None),
+    'yearly': ('yearly', None, None),
+}
+for _ordinal, _n in ORDINALS.items():
+    for _day, _weekday in WEEKDAYS.items():
+        PATTERN_TABLE[f"{_ordinal} {_day}"] = ('nth_weekday', _n, _weekday)
+
+
+def now_local(_now=datetime.now, _tz=LOCAL_TZ) -> datetime:
+    """Get current datetime in local timezone.
 
-def now_local() -> datetime:
-    """Get current datetime in local timezone."""
-    return datetime.now(LOCAL_TZ)
+    datetime.now and the zone are bound as defaults so the hot path skips
+    the module/attribute lookups on every call (ZoneInfo itself is already
+    constructed once at import).
+    """
+    return _now(_tz)
 
 
+@lru_cache(maxsize=1024)
 def parse_date(date_str: str) -> datetime:
-    """Parse ISO format date string."""
-    return datetime.strptime(date_str, "%Y-%m-%d")
+    """Parse ISO format date string.
+
+    Cached (process-local) since batch callers tend to pass the same
+    dates repeatedly; datetime is immutable so sharing results is safe.
+    """
+    # fromisoformat is a C fast path, several times quicker than strptime
+    return datetime.fromisoformat(date_str)
+
+
+MONTH_NAMES = [None, "January", "February", "March", "April", "May", "June",
+               "July", "August", "September", "October", "November", "December"]
 
 
 def format_date(dt: datetime) -> str:
     """Format datetime as ISO date."""
-    return dt.strftime("%Y-%m-%d")
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+
+
+def format_all(dt: datetime) -> tuple[str, str, str]:
+    """Format a date once as (iso, weekday_name, long_form).
+
+    The command handlers need all three representations; building them
+    from the date fields with the precomputed name tables replaces three
+    separate strftime calls (each of which re-parses its format string)
+    with one set of attribute reads.
+    """
+    weekday = WEEKDAY_NAMES[(dt.toordinal() - 1) % 7]
+    iso = f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+    long_form = f"{weekday}, {MONTH_NAMES[dt.month]} {dt.day:02d}, {dt.year}"
+    return iso, weekday, long_form
 
 
 def format_full(dt: datetime) -> str:
     """Format datetime with day name."""
-    return dt.strftime("%A, %B %d, %Y")
+    return format_all(dt)[2]
 
 
 def get_weekday_name(dt: datetime) -> str:
     """Get the day of week name for a date."""
-    return WEEKDAY_NAMES[dt.weekday()]
+    # Ordinal day 1 (0001-01-01) was a Monday, so (ordinal - 1) % 7 gives
+    # the weekday index without the weekday() method-call overhead
+    return WEEKDAY_NAMES[(dt.toordinal() - 1) % 7]
+
+
+def add_months(dt: datetime, n: int) -> datetime:
+    """
+    Add n calendar months to a date, clamping the day to the month's end.
+
+    Matches relativedelta's month arithmetic (e.g. Jan 31 + 1 month =
+    Feb 28/29) without the per-call cost of the pure-Python dateutil path.
+    """
+    m = dt.month - 1 + n
+    year = dt.year + m // 12
+    month = m % 12 + 1
+    day = min(dt.day, calendar.monthrange(year, month)[1])
+    return dt.replace(year=year, month=month, day=day)
 
 
 def add_duration(dt: datetime, duration: str) -> datetime:
@@ -98,9 +166,9 @@ def add_duration(dt: datetime, duration: str) -> datetime:
     elif unit == 'w':
         return dt + timedelta(weeks=amount)
     elif unit == 'm':
-        return dt + relativedelta(months=amount)
+        return add_months(dt, amount)
     elif unit == 'y':
-        return dt + relativedelta(years=amount)
+        return add_months(dt, 12 * amount)
     else:
         raise ValueError(f"Unknown duration unit: {unit}. Use d/w/m/y.")
 
@@ -118,14 +186,15 @@ def nth_weekday_of_month(year: int, month: int, n: int, weekday: int) -> datetim
     Returns:
         datetime of the nth weekday, or raises ValueError if doesn't exist
     """
-    first_day = datetime(year, month, 1)
-    days_until = (weekday - first_day.weekday()) % 7
-    first_occurrence = first_day + timedelta(days=days_until)
-    nth_occurrence = first_occurrence + timedelta(weeks=n-1)
-    
+    # Pure ordinal arithmetic: one datetime construction plus one
+    # fromordinal, instead of three datetime objects via timedelta adds
+    first_ord = datetime(year, month, 1).toordinal()
+    days_until = (weekday - (first_ord - 1)) % 7
+    nth_occurrence = datetime.fromordinal(first_ord + days_until + 7 * (n - 1))
+
     if nth_occurrence.month != month:
         raise ValueError(f"No {n}th {WEEKDAY_NAMES[weekday]} in {year}-{month:02d}")
-    
+
     return nth_occurrence
 
 
@@ -136,51 +205,41 @@ def next_nth_weekday_after(after_date: datetime, n: int, weekday: int) -> dateti
     Used for recurring tasks like "Second Saturday" - after completing on Jan 10,
     find the Second Saturday of the next month.
     """
-    next_month = after_date + relativedelta(months=1)
+    next_month = add_months(after_date, 1)
     year, month = next_month.year, next_month.month
-    
+
     try:
         result = nth_weekday_of_month(year, month, n, weekday)
         return result
     except ValueError:
-        next_month = next_month + relativedelta(months=1)
+        next_month = add_months(next_month, 1)
         return nth_weekday_of_month(next_month.year, next_month.month, n, weekday)
 
 
 def parse_recurring_pattern(pattern: str) -> tuple[str, Optional[int], Optional[int]]:
     """
     Parse a recurring task pattern.
-    
+
+    All valid patterns (including every "first saturday"-style ordinal ×
+    weekday combination) are enumerated in PATTERN_TABLE at import, so the
+    hit path is one canonicalization plus one dict lookup.
+
     Returns:
         Tuple of (pattern_type, n, weekday) where:
         - pattern_type: 'weekly', 'monthly', 'quarterly', 'yearly', 'nth_weekday'
         - n: occurrence number for nth_weekday patterns (1-5)
         - weekday: weekday number (0-6) for nth_weekday patterns
     """
-    pattern_lower = pattern.lower().strip()
-    
-    if pattern_lower == 'weekly':
-        return ('weekly', None, None)
-    elif pattern_lower == 'monthly':
-        return ('monthly', None, None)
-    elif pattern_lower == 'quarterly':
-        return ('quarterly', None, None)
-    elif pattern_lower == 'yearly':
-        return ('yearly', None, None)
-    
-    # Parse "first saturday", "second saturday", etc.
-    ordinals = {
-        'first': 1, 'second': 2, 'third': 3, 'fourth': 4, 'fifth': 5,
-        '1st': 1, '2nd': 2, '3rd': 3, '4th': 4, '5th': 5
-    }
-    
-    parts = pattern_lower.split()
-    if len(parts) == 2:
-        ordinal_str, weekday_str = parts
-        if ordinal_str in ordinals and weekday_str in WEEKDAYS:
-            return ('nth_weekday', ordinals[ordinal_str], WEEKDAYS[weekday_str])
-    
-    raise ValueError(f"Unknown recurring pattern: {pattern}")
+    try:
+        return PATTERN_TABLE[pattern.lower().strip()]
+    except KeyError:
+        pass
+
+    # Retry with interior whitespace collapsed (e.g. "second  saturday")
+    try:
+        return PATTERN_TABLE[' '.join(pattern.lower().split())]
+    except KeyError:
+        raise ValueError(f"Unknown recurring pattern: {pattern}") from None
 
 
 def next_recurring(current_due: datetime, pattern: str) -> datetime:
@@ -199,11 +258,11 @@ def next_recurring(current_due: datetime, pattern: str) -> datetime:
     if pattern_type == 'weekly':
         return current_due + timedelta(days=7)
     elif pattern_type == 'monthly':
-        return current_due + relativedelta(months=1)
+        return add_months(current_due, 1)
     elif pattern_type == 'quarterly':
-        return current_due + relativedelta(months=3)
+        return add_months(current_due, 3)
     elif pattern_type == 'yearly':
-        return current_due + relativedelta(years=1)
+        return add_months(current_due, 12)
     elif pattern_type == 'nth_weekday':
         return next_nth_weekday_after(current_due, n, weekday)
     
@@ -228,12 +287,12 @@ def cmd_now(args):
 def cmd_weekday(args):
     """Handle 'weekday' command."""
     dt = parse_date(args.date)
-    weekday = get_weekday_name(dt)
+    _, weekday, long_form = format_all(dt)
     if args.json:
         return {
             "date": args.date,
             "weekday": weekday,
-            "formatted": format_full(dt)
+            "formatted": long_form
         }
     return f"{args.date} is a {weekday}"
 
@@ -242,15 +301,16 @@ def cmd_add(args):
     """Handle 'add' command."""
     dt = parse_date(args.date)
     result = add_duration(dt, args.duration)
+    iso, weekday, long_form = format_all(result)
     if args.json:
         return {
             "original": args.date,
             "duration": args.duration,
-            "result": format_date(result),
-            "weekday": get_weekday_name(result),
-            "formatted": format_full(result)
+            "result": iso,
+            "weekday": weekday,
+            "formatted": long_form
         }
-    return f"{format_date(result)} ({get_weekday_name(result)})"
+    return f"{iso} ({weekday})"
 
 
 def cmd_nth_weekday(args):
@@ -262,15 +322,16 @@ def cmd_nth_weekday(args):
         raise ValueError(f"Unknown weekday: {args.weekday}")
     
     result = nth_weekday_of_month(year, month, n, weekday)
+    iso, _, long_form = format_all(result)
     if args.json:
         return {
             "year_month": args.year_month,
             "n": n,
             "weekday_name": args.weekday,
-            "result": format_date(result),
-            "formatted": format_full(result)
+            "result": iso,
+            "formatted": long_form
         }
-    return f"{format_date(result)} ({format_full(result)})"
+    return f"{iso} ({long_form})"
 
 
 def cmd_next_nth(args):
@@ -282,33 +343,103 @@ def cmd_next_nth(args):
         raise ValueError(f"Unknown weekday: {args.weekday}")
     
     result = next_nth_weekday_after(dt, n, weekday)
+    iso, _, long_form = format_all(result)
     if args.json:
         return {
             "after_date": args.date,
             "n": n,
             "weekday_name": args.weekday,
-            "result": format_date(result),
-            "formatted": format_full(result)
+            "result": iso,
+            "formatted": long_form
         }
-    return f"{format_date(result)} ({format_full(result)})"
+    return f"{iso} ({long_form})"
 
 
 def cmd_next_recurring(args):
     """Handle 'next-recurring' command."""
     dt = parse_date(args.date)
     result = next_recurring(dt, args.pattern)
+    iso, weekday, long_form = format_all(result)
     if args.json:
         return {
             "current_due": args.date,
             "pattern": args.pattern,
-            "next_due": format_date(result),
-            "weekday": get_weekday_name(result),
-            "formatted": format_full(result)
+            "next_due": iso,
+            "weekday": weekday,
+            "formatted": long_form
         }
-    return f"{format_date(result)} ({get_weekday_name(result)})"
+    return f"{iso} ({weekday})"
+
+
+# Positional argument names for commands eligible for the argparse-free
+# fast path in main()
+FAST_COMMANDS = {
+    'now': (),
+    'weekday': ('date',),
+    'add': ('date', 'duration'),
+    'next-recurring': ('date', 'pattern'),
+    'batch': (),
+}
+
+
+def try_fast_path(argv):
+    """Parse simple invocations without building the argparse tree.
+
+    Building the full subparser tree costs a measurable slice of a CLI
+    call that computes one date. For the common commands with purely
+    positional arguments (plus an optional --json), assemble the args
+    namespace directly. Returns None for anything else (--help, unknown
+    commands, wrong arity), which falls through to full argparse.
+    """
+    flags = [a for a in argv if a.startswith('-')]
+    if flags not in ([], ['--json']):
+        return None
+
+    positional = [a for a in argv if not a.startswith('-')]
+    if not positional:
+        return None
+
+    command, rest = positional[0], positional[1:]
+    arg_names = FAST_COMMANDS.get(command)
+    if arg_names is None or len(rest) != len(arg_names):
+        return None
+
+    return SimpleNamespace(command=command, json=bool(flags),
+                           **dict(zip(arg_names, rest)))
+
+
+def cmd_batch(args):
+    """Handle 'batch' command: next-recurring for many tasks in one process.
+
+    Reads JSONL from stdin ({"date": "YYYY-MM-DD", "pattern": "..."} per
+    line) and writes one JSON result line per input, amortizing interpreter
+    startup and imports over the whole batch instead of paying them per
+    subprocess call. The memoized parsers are shared across all rows.
+    """
+    out = sys.stdout
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+            result = next_recurring(parse_date(request['date']), request['pattern'])
+            out.write(json.dumps({
+                'next_due': format_date(result),
+                'weekday': get_weekday_name(result),
+            }) + '\n')
+        except Exception as e:
+            out.write(json.dumps({'error': str(e)}) + '\n')
 
 
 def main():
+    args = try_fast_path(sys.argv[1:])
+    if args is not None:
+        run_command(args)
+        return
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Date utilities for PWKM task management",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -346,9 +477,16 @@ def main():
     p_recurring = subparsers.add_parser('next-recurring', help='Calculate next due date for recurring task')
     p_recurring.add_argument('date', help='Current due date in YYYY-MM-DD format')
     p_recurring.add_argument('pattern', help='Pattern: weekly, quarterly, yearly, or "second saturday" etc.')
-    
+
+    # batch
+    subparsers.add_parser('batch', help='Compute next-recurring for JSONL tasks on stdin')
+
     args = parser.parse_args()
-    
+    run_command(args)
+
+
+def run_command(args):
+    """Dispatch a parsed command and print its result."""
     try:
         handlers = {
             'now': cmd_now,
@@ -357,15 +495,20 @@ def main():
             'nth-weekday': cmd_nth_weekday,
             'next-nth': cmd_next_nth,
             'next-recurring': cmd_next_recurring,
+            'batch': cmd_batch,
         }
-        
+
         result = handlers[args.command](args)
-        
+
+        if result is None:
+            # Streaming commands (batch) write their own output
+            return
+
         if args.json:
             print(json.dumps(result, indent=2))
         else:
             print(result)
-            
+
     except Exception as e:
         if args.json:
             print(json.dumps({"error": str(e)}), file=sys.stderr)
@@ -21,19 +21,32 @@ Scheduling:
 
 import requests
 import csv
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import os
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+
+# orjson decodes large responses several times faster than stdlib json;
+# fall back silently when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Matches KEY=VALUE lines; comments and blank lines simply don't match
+ENV_LINE_RE = re.compile(r'^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*$', re.MULTILINE)
+
 
 # Load environment variables from .env file
 def load_env_file(env_path: Path) -> dict:
     """
     Load environment variables from a .env file.
 
-    Simple .env parser that handles KEY=VALUE format.
-    For production, consider using python-dotenv package.
+    Single-pass KEY=VALUE parser using one precompiled regex over the
+    whole file. For production, consider using python-dotenv package.
     """
-    env_vars = {}
     if not env_path.exists():
         raise FileNotFoundError(
             f".env file not found at {env_path}\n"
@@ -41,17 +54,9 @@ def load_env_file(env_path: Path) -> dict:
         )
 
     with open(env_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                continue
-            # Parse KEY=VALUE
-            if '=' in line:
-                key, value = line.split('=', 1)
-                env_vars[key.strip()] = value.strip()
-
-    return env_vars
+        data = f.read()
+
+    return {m.group(1): m.group(2) for m in ENV_LINE_RE.finditer(data)}
 
 # Get script directory and load .env file
 SCRIPT_DIR = Path(__file__).parent
@@ -75,14 +80,49 @@ if not NOTION_API_KEY or not DATABASE_ID:
 NOTION_VERSION = "2022-06-28"
 QUERY_URL = f"https://api.notion.com/v1/databases/{DATABASE_ID}/query"
 
+# CSV columns, in the order extract_task_data packs each row
+FIELDNAMES = ["Task Name", "Due Date", "Category", "Frequency", "Priority", "Status", "URL"]
+
+# Shared pooled session, created lazily and reused across in-process calls
+SESSION = None
+
+
+def get_session():
+    """Return the shared pooled session, creating it on first use.
+
+    One keep-alive session per process means the TLS/TCP handshake is paid
+    once even when fetch_all_tasks is invoked repeatedly in-process.
+    """
+    global SESSION
+    if SESSION is None:
+        SESSION = requests.Session()
+        SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+    return SESSION
+
+
+def extract_page(results):
+    """Extract task data from one page of Notion results."""
+    return [extract_task_data(page) for page in results]
+
+
 def fetch_all_tasks():
-    """Fetch all tasks from Notion database"""
+    """Yield task data from the Notion database as pages arrive.
+
+    Notion's cursor pagination is sequential (each next_cursor only arrives
+    with the previous response), so pages are fetched over a single
+    keep-alive connection while a worker thread extracts the previous
+    page's rows in parallel with the next round-trip.
+
+    Yielding rows as they arrive keeps peak memory bounded by one page
+    (~100 tasks) instead of the full result set, so the CSV writer can
+    consume rows while later pages are still in flight.
+    """
     headers = {
         "Authorization": f"Bearer {NOTION_API_KEY}",
         "Notion-Version": NOTION_VERSION,
         "Content-Type": "application/json"
     }
-    
+
     payload = {
         "sorts": [
             {
@@ -92,97 +132,115 @@ def fetch_all_tasks():
         ],
         "page_size": 100
     }
-    
-    all_results = []
+
     has_more = True
     start_cursor = None
-    
-    while has_more:
-        if start_cursor:
-            payload["start_cursor"] = start_cursor
-            
-        response = requests.post(QUERY_URL, headers=headers, json=payload)
-        response.raise_for_status()
-        
-        data = response.json()
-        all_results.extend(data.get("results", []))
-        
-        has_more = data.get("has_more", False)
-        start_cursor = data.get("next_cursor")
-    
-    return all_results
+    session = get_session()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        pending = None
+        while has_more:
+            if start_cursor:
+                payload["start_cursor"] = start_cursor
+
+            if orjson is not None:
+                response = session.post(QUERY_URL, headers=headers,
+                                        data=orjson.dumps(payload))
+            else:
+                response = session.post(QUERY_URL, headers=headers, json=payload)
+            response.raise_for_status()
+
+            data = orjson.loads(response.content) if orjson is not None else response.json()
+            if pending is not None:
+                yield from pending.result()
+            pending = executor.submit(extract_page, data.get("results", []))
+
+            has_more = data.get("has_more", False)
+            start_cursor = data.get("next_cursor")
+
+        if pending is not None:
+            yield from pending.result()
+
+def extract_select(properties, key):
+    """Extract the name of a select property, or '' if unset."""
+    try:
+        return properties[key]["select"]["name"]
+    except (KeyError, TypeError):
+        return ""
+
 
 def extract_task_data(page):
-    """Extract relevant task data from a Notion page object"""
+    """Extract relevant task data from a Notion page object as a FIELDNAMES-ordered tuple"""
     properties = page.get("properties", {})
-    
+
     # Extract task name (title property)
-    task_name = ""
-    if "Task Name" in properties:
-        title_array = properties["Task Name"].get("title", [])
-        if title_array:
-            task_name = title_array[0].get("plain_text", "")
-    
+    try:
+        task_name = properties["Task Name"]["title"][0]["plain_text"]
+    except (KeyError, IndexError, TypeError):
+        task_name = ""
+
     # Extract due date
-    due_date = ""
-    if "Due Date" in properties:
-        date_obj = properties["Due Date"].get("date")
-        if date_obj:
-            due_date = date_obj.get("start", "")
-    
+    try:
+        due_date = properties["Due Date"]["date"]["start"]
+    except (KeyError, TypeError):
+        due_date = ""
+
     # Extract other properties
-    category = properties.get("Category", {}).get("select", {}).get("name", "")
-    frequency = properties.get("Frequency", {}).get("select", {}).get("name", "")
-    priority = properties.get("Priority", {}).get("select", {}).get("name", "")
-    status = properties.get("Status", {}).get("select", {}).get("name", "")
-    
+    category = extract_select(properties, "Category")
+    frequency = extract_select(properties, "Frequency")
+    priority = extract_select(properties, "Priority")
+    status = extract_select(properties, "Status")
+
     # Get page URL
     page_url = page.get("url", "")
-    
-    return {
-        "Task Name": task_name,
-        "Due Date": due_date,
-        "Category": category,
-        "Frequency": frequency,
-        "Priority": priority,
-        "Status": status,
-        "URL": page_url
-    }
+
+    return (task_name, due_date, category, frequency, priority, status, page_url)
 
 def export_to_csv(tasks, output_file):
-    """Export tasks to CSV file"""
-    if not tasks:
+    """Stream task tuples to CSV file, returning the number of rows written.
+
+    Rows stream to a .tmp sibling that replaces the real file only after
+    the whole fetch has succeeded, so an HTTP error on a later page — or
+    an empty result — never clobbers the existing export (the CSV is the
+    only local copy of the task list).
+    """
+    tmp_file = f"{output_file}.tmp"
+    count = 0
+    try:
+        with open(tmp_file, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(FIELDNAMES)
+            for task in tasks:
+                writer.writerow(task)
+                count += 1
+    except BaseException:
+        # Fetch or write died mid-stream; discard the partial temp file
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        raise
+
+    if count:
+        os.replace(tmp_file, output_file)
+        print(f"Successfully exported {count} tasks to {output_file}")
+    else:
+        os.remove(tmp_file)
         print("No tasks to export")
-        return
-    
-    # Define CSV columns
-    fieldnames = ["Task Name", "Due Date", "Category", "Frequency", "Priority", "Status", "URL"]
-    
-    # Write to CSV
-    with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(tasks)
-    
-    print(f"Successfully exported {len(tasks)} tasks to {output_file}")
+
+    return count
 
 def main():
     try:
         print("Fetching tasks from Notion...")
-        pages = fetch_all_tasks()
-        
-        print(f"Found {len(pages)} tasks")
-        
-        # Extract task data
-        tasks = [extract_task_data(page) for page in pages]
-        
+
         # Get script directory
         script_dir = os.path.dirname(os.path.abspath(__file__))
         output_path = os.path.join(script_dir, OUTPUT_FILE)
-        
-        # Export to CSV
-        export_to_csv(tasks, output_path)
-        
+
+        # Stream rows to CSV as pages arrive
+        export_to_csv(fetch_all_tasks(), output_path)
+
         print(f"\nCSV file saved to: {output_path}")
         print(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
@@ -29,18 +29,30 @@ import json
 import os
 import sys
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+# The Google client stack (googleapiclient, google.oauth2, dotenv) takes
+# longer to import than everything else in this file combined, so it is
+# loaded lazily inside get_credentials/get_service — --help and argument
+# errors return without paying for it.
+
+# orjson serializes large responses several times faster than stdlib json;
+# fall back silently when it isn't installed
 try:
-    from dotenv import load_dotenv
-    from google.oauth2.credentials import Credentials
-    from google.auth.transport.requests import Request
-    from googleapiclient.discovery import build
-    from googleapiclient.errors import HttpError
-except ImportError as e:
-    print(f"Missing required package: {e}")
-    sys.exit(1)
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_indented(obj):
+    """Serialize to indented JSON text with the fastest available encoder."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
 
 SCOPES = ['https://www.googleapis.com/auth/calendar.events']
 SCRIPT_DIR = Path(__file__).parent
@@ -50,9 +62,55 @@ LOCAL_TZ_NAME = os.environ.get("LOCAL_TIMEZONE", "America/New_York")
 TZ = ZoneInfo(LOCAL_TZ_NAME)
 
 
+def detect_hour_format():
+    """Pick the platform's no-padding hour directive once at import.
+
+    Windows spells it %#I, everything else %-I; probing a known time here
+    avoids a try/except (and a wasted strftime) on every formatted event.
+    """
+    probe = datetime(2020, 1, 1, 9)
+    try:
+        if probe.strftime('%-I') == '9':
+            return '%-I:%M %p'
+    except ValueError:
+        pass
+    return '%#I:%M %p'
+
+
+HOUR_FMT = detect_hour_format()
+
+
+def atomic_write(path, text):
+    """Write a file via temp-then-rename so a crash can't leave it truncated.
+
+    Matters most for the OAuth token: a corrupted gcal_token.json forces a
+    full interactive re-auth.
+    """
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+@lru_cache(maxsize=1)
 def get_credentials():
-    """Get valid credentials, refreshing if needed."""
-    load_dotenv(ENV_FILE)
+    """Get valid credentials, refreshing if needed.
+
+    Memoized so repeated in-process queries reuse the parsed token instead
+    of re-reading .env and gcal_token.json every call.
+    """
+    try:
+        from google.oauth2.credentials import Credentials
+        from google.auth.transport.requests import Request
+    except ImportError as e:
+        print(f"Missing required package: {e}")
+        sys.exit(1)
+
+    # The client id/secret live in .env only for the initial auth flow;
+    # token refresh reads them from the token file itself, so skip the
+    # .env disk read and parse when the token is already present
+    if not TOKEN_FILE.exists():
+        from dotenv import load_dotenv
+        load_dotenv(ENV_FILE)
     
     if not TOKEN_FILE.exists():
         print("Error: No token file. Run gcal_create.py --auth first.")
@@ -62,8 +120,7 @@ def get_credentials():
     
     if creds and creds.expired and creds.refresh_token:
         creds.refresh(Request())
-        with open(TOKEN_FILE, 'w') as f:
-            f.write(creds.to_json())
+        atomic_write(TOKEN_FILE, creds.to_json())
     
     if not creds or not creds.valid:
         print("Error: Invalid credentials. Run gcal_create.py --auth to re-authorize.")
@@ -102,17 +159,51 @@ def resolve_dates(args):
     return start, end
 
 
-def format_time(dt_str, date_str=None):
-    """Format a datetime or date string compactly."""
-    if date_str:
+@lru_cache(maxsize=64)
+def parse_ymd(date_str):
+    """Parse a YYYY-MM-DD string, cached per distinct date.
+
+    strptime is regex-based and slow; all-day events cluster on the same
+    few dates, so this does O(distinct dates) parses instead of O(events).
+    """
+    return datetime.strptime(date_str, '%Y-%m-%d')
+
+
+def preparse_events(events):
+    """Parse each event's start/end once, caching results on the event dict.
+
+    format_time, classify_event, and the date grouping all consumed the
+    same ISO strings independently, parsing each one 2-3 times per event.
+    One pass attaches _start_dt/_end_dt (timed events), _start_date
+    (all-day events), and _date_key for grouping.
+    """
+    for event in events:
+        start = event.get('start', {})
+        end = event.get('end', {})
+        event['_start_dt'] = event['_end_dt'] = event['_start_date'] = None
+
+        if start.get('dateTime'):
+            dt = datetime.fromisoformat(start['dateTime'])
+            event['_start_dt'] = dt
+            event['_date_key'] = dt.strftime('%Y-%m-%d %a')
+            if end.get('dateTime'):
+                event['_end_dt'] = datetime.fromisoformat(end['dateTime'])
+        elif start.get('date'):
+            event_date = parse_ymd(start['date'])
+            event['_start_date'] = event_date.date()
+            event['_date_key'] = f"{start['date']} {event_date.strftime('%a')}"
+        else:
+            event['_date_key'] = 'unknown'
+
+    return events
+
+
+def format_time(dt, all_day=False):
+    """Format a pre-parsed event time compactly."""
+    if all_day:
         return "all-day"
-    if dt_str:
-        dt = datetime.fromisoformat(dt_str)
-        try:
-            # Windows uses %#I, Linux uses %-I
-            return dt.strftime('%#I:%M %p').lower()
-        except ValueError:
-            return dt.strftime('%-I:%M %p').lower()
+    if dt:
+        return dt.strftime(HOUR_FMT).lower()
     return "?"
 
 
@@ -123,12 +214,9 @@ def classify_event(event, now):
         status: 'completed' | 'in_progress' | 'upcoming_imminent' | 'upcoming_later'
         detail: human-readable detail string (e.g., 'started 13 min ago', 'in 47 min')
     """
-    start_info = event.get('start', {})
-    end_info = event.get('end', {})
-    
     # All-day events: classify based on date only
-    if start_info.get('date'):
-        event_date = datetime.strptime(start_info['date'], '%Y-%m-%d').date()
+    if event['_start_date'] is not None:
+        event_date = event['_start_date']
         today = now.date()
         if event_date < today:
             return {'status': 'completed', 'detail': ''}
@@ -138,34 +226,26 @@ def classify_event(event, now):
             days_until = (event_date - today).days
             return {'status': 'upcoming_later', 'detail': f'in {days_until}d'}
     
-    # Timed events
-    start_dt = datetime.fromisoformat(start_info['dateTime'])
-    end_dt = datetime.fromisoformat(end_info['dateTime'])
-    
-    if start_dt.tzinfo is None:
-        start_dt = start_dt.replace(tzinfo=TZ)
-    if end_dt.tzinfo is None:
-        end_dt = end_dt.replace(tzinfo=TZ)
-    
+    # Timed events. Google's RFC3339 dateTime strings always carry an
+    # offset, so fromisoformat yields aware datetimes — no tzinfo fixup.
+    start_dt = event['_start_dt']
+    end_dt = event['_end_dt']
+
     if now >= end_dt:
         return {'status': 'completed', 'detail': ''}
-    elif now >= start_dt:
+    if now >= start_dt:
         elapsed = int((now - start_dt).total_seconds() / 60)
         return {'status': 'in_progress', 'detail': f'started {elapsed} min ago'}
+
+    # Upcoming: compute minutes once, then pick the label shape
+    minutes_until = int((start_dt - now).total_seconds() / 60)
+    status = 'upcoming_imminent' if minutes_until <= 30 else 'upcoming_later'
+    if minutes_until < 60:
+        detail = f'in {minutes_until} min'
     else:
-        minutes_until = int((start_dt - now).total_seconds() / 60)
-        if minutes_until <= 30:
-            return {'status': 'upcoming_imminent', 'detail': f'in {minutes_until} min'}
-        else:
-            if minutes_until < 60:
-                return {'status': 'upcoming_later', 'detail': f'in {minutes_until} min'}
-            else:
-                hours = minutes_until // 60
-                mins = minutes_until % 60
-                if mins == 0:
-                    return {'status': 'upcoming_later', 'detail': f'in {hours}h'}
-                else:
-                    return {'status': 'upcoming_later', 'detail': f'in {hours}h {mins}m'}
+        hours, mins = divmod(minutes_until, 60)
+        detail = f'in {hours}h {mins}m' if mins else f'in {hours}h'
+    return {'status': status, 'detail': detail}
 
 
 STATUS_LABELS = {
@@ -177,12 +257,11 @@ STATUS_LABELS = {
 
 
 def format_event_compact(event, classify=False, now=None):
-    """Format a single event as a compact one-liner."""
-    start = event.get('start', {})
-    end = event.get('end', {})
-    
-    start_time = format_time(start.get('dateTime'), start.get('date'))
-    end_time = format_time(end.get('dateTime'), end.get('date'))
+    """Format a single pre-parsed event as a compact one-liner."""
+    all_day = event['_start_date'] is not None
+
+    start_time = format_time(event['_start_dt'], all_day)
+    end_time = format_time(event['_end_dt'], all_day)
     summary = event.get('summary', '(no title)')
     location = event.get('location', '')
     
@@ -203,63 +282,115 @@ def format_event_compact(event, classify=False, now=None):
     return line
 
 
-def query_events(start, end, calendar_id='primary'):
-    """Query calendar events in the given range."""
-    creds = get_credentials()
-    service = build('calendar', 'v3', credentials=creds)
-    
-    events_result = service.events().list(
-        calendarId=calendar_id,
-        timeMin=start.isoformat(),
-        timeMax=end.isoformat(),
-        singleEvents=True,
-        orderBy='startTime',
-        timeZone=LOCAL_TZ_NAME
-    ).execute()
-    
-    return events_result.get('items', [])
+# Lazily-built Calendar API service, shared across queries (same pattern
+# as gcal_create)
+SERVICE = None
+
+
+def get_service():
+    """Return a cached Calendar API service, building it on first use."""
+    global SERVICE
+    if SERVICE is None:
+        from googleapiclient.discovery import build
+
+        creds = get_credentials()
+        SERVICE = build('calendar', 'v3', credentials=creds,
+                        cache_discovery=False, static_discovery=True)
+    return SERVICE
+
+
+# Response fields the compact/JSON formatters actually read; --raw passes
+# fields=None to get the unmasked API response
+FIELDS_MASK = 'items(start,end,summary,location),nextPageToken'
+
+
+def query_events(start, end, calendar_ids=('primary',), fields=FIELDS_MASK):
+    """Query calendar events in the given range across one or more calendars.
+
+    Multiple calendars go out as one multipart batch request instead of a
+    sequential HTTP round-trip per calendar. The default fields mask trims
+    each response to the four fields the formatters read — no attendees,
+    conferenceData, attachments, or reminders — which shrinks both the
+    bytes on the wire and the JSON parse cost.
+    """
+    service = get_service()
+
+    def list_request(calendar_id, page_token=None):
+        return service.events().list(
+            calendarId=calendar_id,
+            timeMin=start.isoformat(),
+            timeMax=end.isoformat(),
+            singleEvents=True,
+            orderBy='startTime',
+            timeZone=LOCAL_TZ_NAME,
+            fields=fields,
+            pageToken=page_token
+        )
+
+    def drain(calendar_id, response):
+        """Collect all pages for one calendar, starting from a first response."""
+        items = response.get('items', [])
+        page_token = response.get('nextPageToken')
+        while page_token:
+            response = list_request(calendar_id, page_token).execute()
+            items.extend(response.get('items', []))
+            page_token = response.get('nextPageToken')
+        return items
+
+    if len(calendar_ids) == 1:
+        return drain(calendar_ids[0], list_request(calendar_ids[0]).execute())
+
+    results = {}
+
+    def collect(request_id, response, exception):
+        if exception is not None:
+            raise exception
+        results[request_id] = response
+
+    batch = service.new_batch_http_request(callback=collect)
+    for calendar_id in calendar_ids:
+        batch.add(list_request(calendar_id), request_id=calendar_id)
+    batch.execute()
+
+    events = []
+    for calendar_id in calendar_ids:
+        events.extend(drain(calendar_id, results.get(calendar_id, {})))
+
+    # Each calendar comes back sorted; merge them into one start-time order
+    events.sort(key=lambda e: e['start'].get('dateTime') or e['start'].get('date', ''))
+    return events
 
 
 def output_compact(events, start, end, classify=False):
-    """Output events grouped by date in compact format."""
-    now = datetime.now(TZ) if classify else None
-    
+    """Render events grouped by date in compact format, returning the text."""
     if not events:
-        print(f"No events {start.strftime('%Y-%m-%d')} to {(end - timedelta(days=1)).strftime('%Y-%m-%d')}")
-        return
-    
+        return f"No events {start.strftime('%Y-%m-%d')} to {(end - timedelta(days=1)).strftime('%Y-%m-%d')}"
+
+    now = datetime.now(TZ) if classify else None
+
+    lines = []
     if classify:
-        print(f"As of {now.strftime('%I:%M %p').lstrip('0').lower()}:")
-    
-    by_date = {}
-    for event in events:
-        start_info = event.get('start', {})
-        if start_info.get('dateTime'):
-            dt = datetime.fromisoformat(start_info['dateTime'])
-            date_key = dt.strftime('%Y-%m-%d %a')
-        elif start_info.get('date'):
-            date_key = f"{start_info['date']} {datetime.strptime(start_info['date'], '%Y-%m-%d').strftime('%a')}"
-        else:
-            date_key = 'unknown'
-        
-        by_date.setdefault(date_key, []).append(event)
+        lines.append(f"As of {now.strftime(HOUR_FMT).lower()}:")
     
-    for date_key in sorted(by_date.keys()):
-        print(f"{date_key}:")
-        for event in by_date[date_key]:
-            print(format_event_compact(event, classify=classify, now=now))
+    # Events arrive already ordered by start time, so one linear groupby
+    # pass replaces building a dict of per-date lists
+    for date_key, day_events in groupby(events, key=itemgetter('_date_key')):
+        lines.append(f"{date_key}:")
+        lines.extend(format_event_compact(event, classify=classify, now=now)
+                     for event in day_events)
+
+    return '\n'.join(lines)
 
 
 def output_json(events, classify=False):
-    """Output events as compact JSON."""
+    """Render events as compact JSON, returning the text."""
     now = datetime.now(TZ) if classify else None
     compact = []
     for event in events:
-        start = event.get('start', {})
-        end = event.get('end', {})
+        all_day = event['_start_date'] is not None
         entry = {
-            'time': format_time(start.get('dateTime'), start.get('date')),
-            'end': format_time(end.get('dateTime'), end.get('date')),
+            'time': format_time(event['_start_dt'], all_day),
+            'end': format_time(event['_end_dt'], all_day),
             'summary': event.get('summary', '(no title)'),
         }
         if event.get('location'):
@@ -273,15 +404,33 @@ def output_json(events, classify=False):
     
     result = {'events': compact}
     if classify:
-        result['as_of'] = now.strftime('%I:%M %p').lstrip('0').lower()
-    print(json.dumps(result, indent=2))
+        result['as_of'] = now.strftime(HOUR_FMT).lower()
+    return dumps_indented(result)
+
+
+def render_query(date_spec, end_date=None, classify=False, as_json=False,
+                 calendar_ids=('primary',)):
+    """Query and render events as text.
+
+    In-process API for startup.py — same output as the CLI without
+    spawning a subprocess. Note the helpers exit on auth errors, so
+    callers embedding this should be prepared for SystemExit.
+    """
+    args = argparse.Namespace(date_spec=date_spec, end_date=end_date)
+    start, end = resolve_dates(args)
+    events = [] if start >= end else query_events(start, end, calendar_ids)
+    events = preparse_events(events)
+    if as_json:
+        return output_json(events, classify=classify)
+    return output_compact(events, start, end, classify=classify)
 
 
 def main():
     parser = argparse.ArgumentParser(description='Query Google Calendar (compact output)')
     parser.add_argument('date_spec', help="'today', 'tomorrow', 'week', or YYYY-MM-DD")
     parser.add_argument('end_date', nargs='?', help='End date for range (YYYY-MM-DD)')
-    parser.add_argument('--calendar', '-c', default='primary', help='Calendar ID')
+    parser.add_argument('--calendar', '-c', action='append',
+                        help='Calendar ID (repeatable; default: primary)')
     parser.add_argument('--json', action='store_true', help='Output as compact JSON')
     parser.add_argument('--raw', action='store_true', help='Output full API response')
     parser.add_argument('--classify', action='store_true', help='Classify events vs current time (DONE/NOW/SOON/LATER)')
@@ -289,25 +438,39 @@ def main():
     
     args = parser.parse_args()
     start, end = resolve_dates(args)
-    events = query_events(start, end, args.calendar)
-    
-    import io
-    if args.output:
-        buf = io.StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = buf
+
+    # A trivially-empty range (end date before start) needs no credentials
+    # and no discovery service build — render the empty output directly
+    if start >= end:
+        events = []
+    else:
+        # --raw promises the full API response, so it skips the mask
+        events = query_events(start, end, args.calendar or ('primary',),
+                              fields=None if args.raw else FIELDS_MASK)
     
     if args.raw:
-        print(json.dumps(events, indent=2))
-    elif args.json:
-        output_json(events, classify=args.classify)
+        # Raw dumps are by far the largest output this script produces;
+        # json.dump streams chunks straight to the destination instead of
+        # double-representing the payload as a full string first.
+        out = open(args.output, 'w') if args.output else sys.stdout
+        try:
+            json.dump(events, out, indent=2)
+            out.write('\n')
+        finally:
+            if args.output:
+                out.close()
+        return
+
+    if args.json:
+        text = output_json(preparse_events(events), classify=args.classify)
     else:
-        output_compact(events, start, end, classify=args.classify)
-    
+        text = output_compact(preparse_events(events), start, end, classify=args.classify)
+
     if args.output:
-        sys.stdout = old_stdout
         with open(args.output, 'w') as f:
-            f.write(buf.getvalue())
+            f.write(text + '\n')
+    else:
+        print(text)
 
 
 if __name__ == '__main__':
@@ -25,14 +25,22 @@ Configuration:
     Set PWKM_STATE_DIR env var to override state file location.
 """
 
-import argparse
 import json
 import os
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 from zoneinfo import ZoneInfo
 
+# orjson parses and serializes state files faster than stdlib json;
+# fall back silently when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 TZ_NAME = os.environ.get("LOCAL_TIMEZONE", "America/New_York")
 TZ = ZoneInfo(TZ_NAME)
 SCRIPT_DIR = Path(__file__).parent
@@ -46,40 +54,98 @@ def now():
     return datetime.now(TZ)
 
 
+def atomic_write(path, data):
+    """Write a file via temp-then-rename so a crash can't leave it truncated."""
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    if isinstance(data, bytes):
+        tmp.write_bytes(data)
+    else:
+        tmp.write_text(data)
+    os.replace(tmp, path)
+
+
+def load_json_file(path):
+    """Load a JSON state file with the fastest available decoder."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_json_file(path, state):
+    """Write a JSON state file atomically with the fastest available encoder."""
+    if orjson is not None:
+        atomic_write(path, orjson.dumps(state, option=orjson.OPT_INDENT_2))
+    else:
+        atomic_write(path, json.dumps(state, indent=2))
+
+
 def load_state():
     if STATE_FILE.exists():
-        with open(STATE_FILE, 'r') as f:
-            return json.load(f)
+        return load_json_file(STATE_FILE)
     return {}
 
 
 def save_state(state):
-    with open(STATE_FILE, 'w') as f:
-        json.dump(state, f, indent=2)
+    save_json_file(STATE_FILE, state)
 
 
-def fmt_time(iso_str):
-    """Format ISO string to readable time."""
-    dt = datetime.fromisoformat(iso_str)
+def fmt_time(epoch):
+    """Format an epoch timestamp to readable local time."""
+    dt = datetime.fromtimestamp(epoch, TZ)
     return dt.strftime('%I:%M %p').lstrip('0').lower()
 
 
-def minutes_since(iso_str):
-    """Minutes elapsed since an ISO timestamp."""
-    dt = datetime.fromisoformat(iso_str)
-    delta = now() - dt
-    return int(delta.total_seconds() / 60)
+def state_epoch(state, key):
+    """Return the epoch seconds for a state key.
 
+    Timestamps are stored as epoch ints (plus an ISO twin for human
+    readability); states written before the epoch fields existed fall
+    back to parsing the ISO string.
+    """
+    epoch = state.get(key + '_epoch')
+    if epoch is not None:
+        return epoch
+    iso = state.get(key)
+    return datetime.fromisoformat(iso).timestamp() if iso else None
 
-def cmd_start(args):
-    """Record session start time."""
+
+def set_timestamp(state, key, dt):
+    """Record a timestamp under key as both epoch int and readable ISO."""
+    state[key] = dt.isoformat()
+    state[key + '_epoch'] = int(dt.timestamp())
+
+
+def minutes_since(epoch, ref=None):
+    """Minutes elapsed since an epoch timestamp.
+
+    Plain float subtraction — no per-call ZoneInfo offset lookups like the
+    old aware-datetime arithmetic. Pass ref to reuse one clock reading
+    across several elapsed-time computations.
+    """
+    if ref is None:
+        ref = time.time()
+    return int((ref - epoch) / 60)
+
+
+def start_session():
+    """Record session start time and return the confirmation message.
+
+    Callable in-process (startup.py) as well as from the CLI.
+    """
     state = load_state()
     n = now()
-    state['session_start'] = n.isoformat()
-    state['last_summary_update'] = n.isoformat()
+    set_timestamp(state, 'session_start', n)
+    set_timestamp(state, 'last_summary_update', n)
     state['update_count'] = 0
     save_state(state)
-    print(f"Session started at {fmt_time(n.isoformat())}. Timer running.")
+    return f"Session started at {fmt_time(n.timestamp())}. Timer running."
+
+
+def cmd_start(args):
+    """Record session start time."""
+    print(start_session())
 
 
 def cmd_update(args):
@@ -87,14 +153,15 @@ def cmd_update(args):
     state = load_state()
     if not state.get('session_start'):
         print("Warning: No session started. Starting one now.")
-        state['session_start'] = now().isoformat()
+        set_timestamp(state, 'session_start', now())
 
     n = now()
-    elapsed = minutes_since(state.get('last_summary_update', n.isoformat()))
-    state['last_summary_update'] = n.isoformat()
+    last_epoch = state_epoch(state, 'last_summary_update')
+    elapsed = minutes_since(last_epoch, ref=n.timestamp()) if last_epoch is not None else 0
+    set_timestamp(state, 'last_summary_update', n)
     state['update_count'] = state.get('update_count', 0) + 1
     save_state(state)
-    print(f"Running summary update recorded at {fmt_time(n.isoformat())} ({elapsed} min since last).")
+    print(f"Running summary update recorded at {fmt_time(n.timestamp())} ({elapsed} min since last).")
     print(f"Total updates this session: {state['update_count']}")
 
 
@@ -109,17 +176,19 @@ def cmd_check(args):
             print("No active session. Run 'start' first.")
         return
 
-    n = now()
-    since_start = minutes_since(state['session_start'])
-    since_update = minutes_since(state.get('last_summary_update', state['session_start']))
+    now_epoch = time.time()
+    start_epoch = state_epoch(state, 'session_start')
+    update_epoch = state_epoch(state, 'last_summary_update') or start_epoch
+    since_start = minutes_since(start_epoch, ref=now_epoch)
+    since_update = minutes_since(update_epoch, ref=now_epoch)
     overdue = since_update >= THRESHOLD_MINUTES
 
     if args.json:
         result = {
-            "current_time": fmt_time(n.isoformat()),
-            "session_start": fmt_time(state['session_start']),
+            "current_time": fmt_time(now_epoch),
+            "session_start": fmt_time(start_epoch),
             "minutes_since_start": since_start,
-            "last_summary_update": fmt_time(state.get('last_summary_update', state['session_start'])),
+            "last_summary_update": fmt_time(update_epoch),
             "minutes_since_update": since_update,
             "overdue": overdue,
             "update_count": state.get('update_count', 0),
@@ -128,9 +197,9 @@ def cmd_check(args):
         print(json.dumps(result))
     else:
         status = "⚠️ OVERDUE" if overdue else "OK"
-        print(f"Time: {fmt_time(n.isoformat())}")
-        print(f"Session: {since_start} min (started {fmt_time(state['session_start'])})")
-        print(f"Last summary: {since_update} min ago ({fmt_time(state.get('last_summary_update', state['session_start']))})")
+        print(f"Time: {fmt_time(now_epoch)}")
+        print(f"Session: {since_start} min (started {fmt_time(start_epoch)})")
+        print(f"Last summary: {since_update} min ago ({fmt_time(update_epoch)})")
         print(f"Status: {status} (threshold: {THRESHOLD_MINUTES} min)")
         print(f"Updates this session: {state.get('update_count', 0)}")
 
@@ -143,21 +212,21 @@ def cmd_status(args):
 
 def load_audit_state():
     if AUDIT_FILE.exists():
-        with open(AUDIT_FILE, 'r') as f:
-            return json.load(f)
+        return load_json_file(AUDIT_FILE)
     return {}
 
 
 def save_audit_state(state):
-    with open(AUDIT_FILE, 'w') as f:
-        json.dump(state, f, indent=2)
+    save_json_file(AUDIT_FILE, state)
 
 
-def cmd_audit_check(args):
-    """Check if weekly audit or monthly idea review is needed."""
+def audit_check_data():
+    """Compute audit trigger flags as a dict.
+
+    Shared by the CLI command and in-process callers (startup.py).
+    """
     audit = load_audit_state()
-    n = now()
-    today = n.date()
+    today = now().date()
     weekday = today.weekday()
 
     last_weekly = audit.get('last_weekly_audit')
@@ -177,29 +246,42 @@ def cmd_audit_check(args):
     else:
         monthly_needed = first_week
 
-    if args.json:
-        result = {
-            'weekly_audit_needed': weekly_needed,
-            'days_since_weekly_audit': days_since_weekly,
-            'monthly_review_needed': monthly_needed,
-            'is_first_week': first_week,
-            'today': today.isoformat(),
-            'weekday': ['Monday','Tuesday','Wednesday','Thursday','Friday','Saturday','Sunday'][weekday],
-        }
-        print(json.dumps(result))
+    return {
+        'weekly_audit_needed': weekly_needed,
+        'days_since_weekly_audit': days_since_weekly,
+        'monthly_review_needed': monthly_needed,
+        'is_first_week': first_week,
+        'today': today.isoformat(),
+        'weekday': ['Monday','Tuesday','Wednesday','Thursday','Friday','Saturday','Sunday'][weekday],
+    }
+
+
+def format_audit_report(data):
+    """Render audit flags as the human-readable report lines."""
+    days_since_weekly = data['days_since_weekly_audit']
+    lines = []
+    if data['weekly_audit_needed']:
+        since = f' (last: {days_since_weekly}d ago)' if days_since_weekly else ' (never done)'
+        lines.append(f'** WEEKLY AUDIT NEEDED{since}')
     else:
-        if weekly_needed:
-            since = f' (last: {days_since_weekly}d ago)' if days_since_weekly else ' (never done)'
-            print(f'** WEEKLY AUDIT NEEDED{since}')
-        else:
-            print(f'Weekly audit: OK (last: {days_since_weekly}d ago)')
+        lines.append(f'Weekly audit: OK (last: {days_since_weekly}d ago)')
+
+    if data['monthly_review_needed']:
+        lines.append('** MONTHLY IDEA REVIEW NEEDED (first week of month)')
+    elif data['is_first_week']:
+        lines.append('Monthly idea review: OK (already done this month)')
+    else:
+        lines.append('Monthly idea review: not due (not first week)')
+    return '\n'.join(lines)
 
-        if monthly_needed:
-            print('** MONTHLY IDEA REVIEW NEEDED (first week of month)')
-        elif first_week:
-            print('Monthly idea review: OK (already done this month)')
-        else:
-            print('Monthly idea review: not due (not first week)')
+
+def cmd_audit_check(args):
+    """Check if weekly audit or monthly idea review is needed."""
+    data = audit_check_data()
+    if args.json:
+        print(json.dumps(data))
+    else:
+        print(format_audit_report(data))
 
 
 def cmd_audit_done(args):
@@ -207,7 +289,7 @@ def cmd_audit_done(args):
     audit = load_audit_state()
     n = now()
     audit['last_weekly_audit'] = n.isoformat()
-    print(f'Weekly audit recorded at {fmt_time(n.isoformat())}.')
+    print(f'Weekly audit recorded at {fmt_time(n.timestamp())}.')
 
     if args.monthly:
         audit['last_monthly_review'] = n.isoformat()
@@ -216,24 +298,33 @@ def cmd_audit_done(args):
     save_audit_state(audit)
 
 
+COMMANDS = {
+    'start': cmd_start,
+    'update': cmd_update,
+    'check': cmd_check,
+    'status': cmd_status,
+    'audit-check': cmd_audit_check,
+    'audit-done': cmd_audit_done,
+}
+
+USAGE = (
+    "usage: session_timer.py {start,update,check,status,audit-check,audit-done}"
+    " [--json] [--monthly]"
+)
+
+
 def main():
-    parser = argparse.ArgumentParser(description='Session timer for running summary enforcement')
-    parser.add_argument('command', choices=['start', 'update', 'check', 'status', 'audit-check', 'audit-done'],
-                        help='Command to execute')
-    parser.add_argument('--json', action='store_true', help='JSON output')
-    parser.add_argument('--monthly', action='store_true', help='Also record monthly review (for audit-done)')
-
-    args = parser.parse_args()
-
-    commands = {
-        'start': cmd_start,
-        'update': cmd_update,
-        'check': cmd_check,
-        'status': cmd_status,
-        'audit-check': cmd_audit_check,
-        'audit-done': cmd_audit_done,
-    }
-    commands[args.command](args)
+    # Hand-rolled dispatch: this script runs every 30 minutes and its
+    # commands do trivial work, so argparse construction was most of the
+    # wall time. The flag set is tiny and fixed.
+    argv = sys.argv[1:]
+    command = argv[0] if argv else None
+    if command not in COMMANDS:
+        print(USAGE, file=sys.stderr)
+        sys.exit(2)
+
+    args = SimpleNamespace(json='--json' in argv, monthly='--monthly' in argv)
+    COMMANDS[command](args)
 
 
 if __name__ == '__main__':
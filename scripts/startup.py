@@ -35,10 +35,18 @@ import json
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+# orjson serializes the report several times faster than stdlib json;
+# fall back silently when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 TZ_NAME = os.environ.get("LOCAL_TIMEZONE", "America/New_York")
 TZ = ZoneInfo(TZ_NAME)
 SCRIPT_DIR = Path(__file__).parent
@@ -60,7 +68,12 @@ def run_script(script_name, args=None, timeout=15):
             timeout=timeout,
             cwd=str(SCRIPT_DIR.parent),
             encoding='utf-8',
-            errors='replace'
+            errors='replace',
+            # With close_fds=False (and no preexec_fn) CPython launches the
+            # child via posix_spawn instead of fork+exec, skipping the
+            # page-table copy of this process. Safe: we only ever spawn our
+            # own sibling scripts and hold no sensitive inherited fds.
+            close_fds=False
         )
         output = result.stdout.strip()
         if result.returncode != 0:
@@ -86,8 +99,30 @@ def get_datetime():
     }
 
 
+# The sibling scripts live in this directory, so the fast path imports
+# them and calls their entry points in-process — no interpreter cold
+# start, no JSON round-trip through stdout. Any failure (import error,
+# missing CSV, auth problem) falls back to the original subprocess path,
+# which reproduces the error message the report expects.
+
 def get_calendar(classify=True, scope='today+tomorrow', use_json=False):
-    """Get calendar via gcal_query.py."""
+    """Get calendar via gcal_query, in-process when possible."""
+    try:
+        from gcal_query import TOKEN_FILE, render_query
+        # gcal_query prints its own error and exits when the token file
+        # is missing; from a worker thread that text would leak into the
+        # middle of the report, so only go in-process when a token
+        # already exists
+        if TOKEN_FILE.exists():
+            output = render_query(scope, classify=classify, as_json=use_json)
+            if use_json:
+                return {'success': True, 'data': json.loads(output)}
+            return {'success': True, 'output': output}
+    except (Exception, SystemExit):
+        # gcal_query exits on auth errors; retry via subprocess so the
+        # failure surfaces as a report line instead of killing startup
+        pass
+
     args = [scope]
     if classify:
         args.append('--classify')
@@ -103,7 +138,13 @@ def get_calendar(classify=True, scope='today+tomorrow', use_json=False):
 
 
 def get_tasks():
-    """Get task status via task_manager.py."""
+    """Get task status via task_manager, in-process when possible."""
+    try:
+        from task_manager import status_data
+        return {'success': True, 'data': status_data()}
+    except Exception:
+        pass
+
     success, output = run_script('task_manager.py', ['--json', 'status'])
     if success:
         try:
@@ -114,7 +155,16 @@ def get_tasks():
 
 
 def get_audit_status(use_json=False):
-    """Check audit triggers via session_timer.py."""
+    """Check audit triggers via session_timer, in-process when possible."""
+    try:
+        from session_timer import audit_check_data, format_audit_report
+        data = audit_check_data()
+        if use_json:
+            return {'success': True, 'data': data}
+        return {'success': True, 'output': format_audit_report(data)}
+    except Exception:
+        pass
+
     args = ['audit-check']
     if use_json:
         args.append('--json')
@@ -128,7 +178,13 @@ def get_audit_status(use_json=False):
 
 
 def start_session_timer():
-    """Start session timer via session_timer.py."""
+    """Start session timer via session_timer, in-process when possible."""
+    try:
+        from session_timer import start_session
+        return {'success': True, 'output': start_session()}
+    except Exception:
+        pass
+
     success, output = run_script('session_timer.py', ['start'])
     return {'success': success, 'output': output}
 
@@ -212,7 +268,11 @@ def format_json_report(dt, calendar, tasks, audit, timer):
         'audit': audit_data,
         'session_timer': {'success': timer['success'], 'output': timer['output']},
     }
-    return json.dumps(report, indent=2, default=str)
+    # --json output is consumed programmatically, so skip pretty-printing:
+    # compact separators encode faster and shrink the payload ~3x
+    if orjson is not None:
+        return orjson.dumps(report, default=str).decode()
+    return json.dumps(report, separators=(',', ':'), default=str)
 
 
 def main():
@@ -225,15 +285,27 @@ def main():
     args = parser.parse_args()
     
     dt = get_datetime()
-    
-    if args.skip_calendar:
-        calendar = {'success': False, 'output': 'Skipped (--skip-calendar)'}
-    else:
-        calendar = get_calendar(scope=args.calendar_scope, use_json=args.json)
-    
-    tasks = get_tasks()
-    audit = get_audit_status(use_json=args.json)
-    timer = start_session_timer()
+
+    # The four checks are independent and each one blocks on a subprocess
+    # (the calendar also on a network round-trip), so run them concurrently.
+    # Wall-clock startup becomes the slowest single check — in practice the
+    # calendar API call — instead of the sum of all four.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            'tasks': executor.submit(get_tasks),
+            'audit': executor.submit(get_audit_status, use_json=args.json),
+            'timer': executor.submit(start_session_timer),
+        }
+        if not args.skip_calendar:
+            futures['calendar'] = executor.submit(
+                get_calendar, scope=args.calendar_scope, use_json=args.json)
+        results = {name: future.result() for name, future in futures.items()}
+
+    calendar = results.get('calendar',
+                           {'success': False, 'output': 'Skipped (--skip-calendar)'})
+    tasks = results['tasks']
+    audit = results['audit']
+    timer = results['timer']
     
     if args.json:
         print(format_json_report(dt, calendar, tasks, audit, timer))
@@ -20,26 +20,55 @@ CSV Format Expected:
     Task Name, Due Date, Category, Frequency, Priority, Status, URL
 
 Configuration:
-    Set LOCAL_TIMEZONE env var or edit LOCAL_TZ below. Default: America/Toronto
+    Set LOCAL_TIMEZONE env var (shared with date_utils.py). Default: America/Toronto
     Set PWKM_TASKS_CSV env var or edit DEFAULT_CSV_NAME below for CSV location.
     The script auto-detects CSV in its own directory first, then falls back.
 """
 
-import argparse
-import csv
-import json
 import os
+import re
 import sys
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from zoneinfo import ZoneInfo
-from dateutil.relativedelta import relativedelta
+from types import SimpleNamespace
 from typing import Optional, List, Dict, Any
 
+# argparse, csv, io and json are imported lazily where used: a fast-path
+# `status` never builds a parser or touches json (orjson handles the
+# encode), so those modules stay off its cold-start cost.
+
+from date_utils import (
+    ORDINALS,
+    WEEKDAYS,
+    add_months,
+    format_date,
+    get_weekday_name,
+    next_nth_weekday_after,
+    now_local,
+    parse_date,
+)
+
+# orjson encodes the --json payloads several times faster than stdlib
+# json; fall back silently when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuration
-LOCAL_TZ = ZoneInfo(os.environ.get("LOCAL_TIMEZONE", "America/Toronto"))
 DEFAULT_CSV_NAME = "notion_tasks.csv"
 
+# Statuses that exclude a task from due/overdue reporting
+DONE_STATUSES = frozenset({'done'})
+
+# Matches the "(First Saturday)"-style recurrence hint in a task name
+PATTERN_RE = re.compile(r'\(([^)]+)\)')
+
+# Sort/bisect key for tasks with no due date — sorts after any real date
+UNDATED_ORD = datetime.max.toordinal()
+
 def get_csv_path() -> Path:
     """Find CSV file - check env var, then script directory, then parent."""
     # Check environment variable first
@@ -63,69 +92,22 @@ def get_csv_path() -> Path:
     # Return local path for error message
     return local_csv
 
-WEEKDAYS = {
-    "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
-    "friday": 4, "saturday": 5, "sunday": 6
-}
-
-WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-
-
 # =============================================================================
-# Date Utilities (incorporated from date_utils.py for self-contained operation)
+# Date Utilities (shared with date_utils.py; task-specific helpers below)
 # =============================================================================
 
-def now_local() -> datetime:
-    """Get current datetime in local timezone."""
-    return datetime.now(LOCAL_TZ)
-
-
+@lru_cache(maxsize=1)
 def today_local() -> datetime:
-    """Get today's date (midnight) in local timezone."""
+    """Get today's date (midnight) in local timezone.
+
+    Cached for the process lifetime: every command treats 'today' as a
+    constant, and this is a one-shot CLI, so one clock read and one
+    ZoneInfo offset lookup cover the whole invocation.
+    """
     n = now_local()
     return datetime(n.year, n.month, n.day)
 
 
-def parse_date(date_str: str) -> datetime:
-    """Parse ISO format date string."""
-    return datetime.strptime(date_str, "%Y-%m-%d")
-
-
-def format_date(dt: datetime) -> str:
-    """Format datetime as ISO date."""
-    return dt.strftime("%Y-%m-%d")
-
-
-def get_weekday_name(dt: datetime) -> str:
-    """Get the day of week name for a date."""
-    return WEEKDAY_NAMES[dt.weekday()]
-
-
-def nth_weekday_of_month(year: int, month: int, n: int, weekday: int) -> datetime:
-    """Find the nth occurrence of a weekday in a given month."""
-    first_day = datetime(year, month, 1)
-    days_until = (weekday - first_day.weekday()) % 7
-    first_occurrence = first_day + timedelta(days=days_until)
-    nth_occurrence = first_occurrence + timedelta(weeks=n-1)
-    
-    if nth_occurrence.month != month:
-        raise ValueError(f"No {n}th {WEEKDAY_NAMES[weekday]} in {year}-{month:02d}")
-    
-    return nth_occurrence
-
-
-def next_nth_weekday_after(after_date: datetime, n: int, weekday: int) -> datetime:
-    """Find the next nth weekday of a month after a given date."""
-    next_month = after_date + relativedelta(months=1)
-    year, month = next_month.year, next_month.month
-    
-    try:
-        return nth_weekday_of_month(year, month, n, weekday)
-    except ValueError:
-        next_month = next_month + relativedelta(months=1)
-        return nth_weekday_of_month(next_month.year, next_month.month, n, weekday)
-
-
 def parse_task_name_for_pattern(task_name: str) -> tuple[str, Optional[int], Optional[int]]:
     """
     Extract recurrence pattern from task name.
@@ -134,22 +116,15 @@ def parse_task_name_for_pattern(task_name: str) -> tuple[str, Optional[int], Opt
         "Haircut (First Saturday)"
         "Garden Cleanup (Second Saturday)"
     """
-    ordinals = {
-        'first': 1, 'second': 2, 'third': 3, 'fourth': 4, 'fifth': 5,
-        '1st': 1, '2nd': 2, '3rd': 3, '4th': 4, '5th': 5
-    }
-    
-    import re
-    match = re.search(r'\(([^)]+)\)', task_name.lower())
+    match = PATTERN_RE.search(task_name.lower())
     if match:
-        pattern_text = match.group(1).strip()
-        parts = pattern_text.split()
-        
+        parts = match.group(1).split()
+
         if len(parts) == 2:
             ordinal_str, weekday_str = parts
-            if ordinal_str in ordinals and weekday_str in WEEKDAYS:
-                return ('nth_weekday', ordinals[ordinal_str], WEEKDAYS[weekday_str])
-    
+            if ordinal_str in ORDINALS and weekday_str in WEEKDAYS:
+                return ('nth_weekday', ORDINALS[ordinal_str], WEEKDAYS[weekday_str])
+
     return ('unknown', None, None)
 
 
@@ -165,16 +140,16 @@ def calculate_next_due_date(current_due: datetime, frequency: str, task_name: st
     elif freq_lower == 'weekly':
         return current_due + timedelta(days=7)
     elif freq_lower == 'quarterly':
-        return current_due + relativedelta(months=3)
+        return add_months(current_due, 3)
     elif freq_lower == 'yearly':
-        return current_due + relativedelta(years=1)
+        return add_months(current_due, 12)
     elif freq_lower == 'monthly':
         # Check if task name specifies nth weekday pattern
         pattern_type, n, weekday = parse_task_name_for_pattern(task_name)
         if pattern_type == 'nth_weekday':
             return next_nth_weekday_after(current_due, n, weekday)
         else:
-            return current_due + relativedelta(months=1)
+            return add_months(current_due, 1)
     
     raise ValueError(f"Unknown frequency pattern: {frequency}")
 
@@ -183,83 +158,203 @@ def calculate_next_due_date(current_due: datetime, frequency: str, task_name: st
 # Task Management
 # =============================================================================
 
-def read_tasks(csv_path: Path) -> List[Dict[str, Any]]:
-    """Read all tasks from CSV file."""
+@lru_cache(maxsize=4)
+def read_tasks_cached(csv_path_str: str, mtime_ns: int) -> tuple[List[Dict[str, Any]], List[int]]:
+    """Parse the CSV once per (path, mtime); mtime_ns keys cache freshness."""
+    import csv
+
     tasks = []
-    with open(csv_path, 'r', newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+    with open(csv_path_str, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return tasks, []
+
+        # Positional csv.reader skips DictReader's per-row dict of
+        # header->value pairs; column indices are resolved once from the
+        # header. Missing columns index the '' sentinel appended to each
+        # row, which also covers short rows in hand-edited files.
+        col = {name: i for i, name in enumerate(header)}
+        name_i = col.get('Task Name', -1)
+        due_i = col.get('Due Date', -1)
+        cat_i = col.get('Category', -1)
+        freq_i = col.get('Frequency', -1)
+        pri_i = col.get('Priority', -1)
+        status_i = col.get('Status', -1)
+        url_i = col.get('URL', -1)
+        width = len(header) + 1
+        # Local bindings skip the module-global lookups inside the row loop
+        parse = parse_date
+        weekday_name = get_weekday_name
+
         for row in reader:
+            if len(row) < width:
+                row = row + [''] * (width - len(row))
+
+            due_str = row[due_i]
             due_date = None
-            if row.get('Due Date'):
+            if due_str:
+                # Notion appends a time and UTC offset when a date
+                # property carries a time; keep only the date part so
+                # every parsed value is a naive midnight (an aware
+                # datetime would make the sort/bisect comparisons
+                # against today and datetime.max raise TypeError)
                 try:
-                    due_date = parse_date(row['Due Date'])
+                    due_date = parse(due_str[:10])
                 except ValueError:
                     pass
-            
+
+            name = row[name_i]
+            status = row[status_i]
             tasks.append({
-                'name': row.get('Task Name', ''),
+                'name': name,
+                'name_lower': name.lower(),
                 'due_date': due_date,
-                'due_date_str': row.get('Due Date', ''),
-                'category': row.get('Category', ''),
-                'frequency': row.get('Frequency', ''),
-                'priority': row.get('Priority', ''),
-                'status': row.get('Status', ''),
-                'url': row.get('URL', ''),
+                'due_date_str': due_str,
+                'weekday_name': weekday_name(due_date) if due_date else '',
+                'category': row[cat_i],
+                'frequency': row[freq_i],
+                'priority': row[pri_i],
+                'status': status,
+                'is_done': status.lower() in DONE_STATUSES,
+                'url': row[url_i],
             })
-    
-    return tasks
+
+    # Sort by due date (undated tasks last, matching write_tasks) and keep
+    # a parallel key list so commands can bisect to a date window instead
+    # of scanning every row. The CSV is normally already in this order, so
+    # the sort is a near-no-op pass that enforces the invariant. The keys
+    # are ordinal ints rather than datetimes: int comparisons inside
+    # bisect are single C-level compares, not datetime tuple comparisons.
+    tasks.sort(key=lambda t: (t['due_date'] or datetime.max, t['name']))
+    due_ords = [t['due_date'].toordinal() if t['due_date'] else UNDATED_ORD
+                for t in tasks]
+    return tasks, due_ords
+
+
+def read_tasks(csv_path: Path, mutable: bool = False) -> List[Dict[str, Any]]:
+    """Read all tasks from CSV file.
+
+    The parse is cached per (path, mtime), so e.g. a status check followed
+    by a completion in the same process only parses the file once.
+    Read-only commands share the cached list directly; pass mutable=True
+    (cmd_complete) to get independent dict copies that are safe to edit.
+    Tasks come back sorted by due date, undated tasks last.
+    """
+    cached, _ = read_tasks_cached(str(csv_path), csv_path.stat().st_mtime_ns)
+    if mutable:
+        return [dict(task) for task in cached]
+    return cached
+
+
+def read_tasks_indexed(csv_path: Path) -> tuple[List[Dict[str, Any]], List[int]]:
+    """Return (tasks, due_ords): due-date-sorted tasks plus the parallel
+    ordinal key list for bisect lookups (undated tasks appear as
+    UNDATED_ORD)."""
+    return read_tasks_cached(str(csv_path), csv_path.stat().st_mtime_ns)
 
 
 def write_tasks(csv_path: Path, tasks: List[Dict[str, Any]]) -> None:
-    """Write all tasks back to CSV file."""
+    """Write all tasks back to CSV file atomically.
+
+    The rows go to a .tmp sibling which is then os.replace'd over the
+    real file, so a crash mid-write can't truncate the task list (the
+    CSV is the only local copy until the next Notion export).
+    """
+    import csv
+    import io
+
     fieldnames = ['Task Name', 'Due Date', 'Category', 'Frequency', 'Priority', 'Status', 'URL']
-    
-    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for task in tasks:
-            writer.writerow({
-                'Task Name': task['name'],
-                'Due Date': task['due_date_str'],
-                'Category': task['category'],
-                'Frequency': task['frequency'],
-                'Priority': task['priority'],
-                'Status': task['status'],
-                'URL': task['url'],
-            })
+    tmp_path = csv_path.with_suffix(csv_path.suffix + '.tmp')
+
+    # Notion exports arrive sorted by due date; re-sort here (undated
+    # tasks last) so reschedules don't break that invariant and read
+    # paths can rely on on-disk order. Writes are rare, reads frequent.
+    tasks = sorted(tasks, key=lambda t: (t['due_date'] or datetime.max, t['name']))
+
+    # Render the whole file in memory first: writerows over tuples skips
+    # DictWriter's per-row field mapping, and the single f.write issues
+    # one buffered write instead of one per row
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(fieldnames)
+    writer.writerows(
+        (task['name'], task['due_date_str'], task['category'],
+         task['frequency'], task['priority'], task['status'], task['url'])
+        for task in tasks
+    )
+
+    with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+        f.write(buf.getvalue())
+
+    os.replace(tmp_path, csv_path)
+
+    # mtime keying would usually catch this, but clear explicitly in case
+    # the rewrite lands within the filesystem's timestamp granularity
+    read_tasks_cached.cache_clear()
 
 
 def find_task(tasks: List[Dict[str, Any]], task_name: str) -> Optional[Dict[str, Any]]:
-    """Find a task by name (case-insensitive partial match)."""
-    task_name_lower = task_name.lower()
-    
-    for task in tasks:
-        if task['name'].lower() == task_name_lower:
-            return task
-    
+    """Find a task by name (case-insensitive partial match).
+
+    Single pass: an exact match returns immediately, otherwise the first
+    substring hit (same precedence as the old two-pass version) is
+    remembered and returned at the end.
+    """
+    needle = task_name.lower()
+    substring_hit = None
+
     for task in tasks:
-        if task_name_lower in task['name'].lower():
+        name = task['name_lower']
+        if name == needle:
             return task
-    
-    return None
+        if substring_hit is None and needle in name:
+            substring_hit = task
+
+    return substring_hit
 
 
 def format_task(task: Dict[str, Any], include_weekday: bool = True) -> str:
-    """Format a task for display."""
-    parts = [task['name']]
-    
+    """Format a task for display.
+
+    Builds the string directly rather than joining a parts list — this
+    runs once per row per render, so the list/join overhead was the
+    bulk of its cost.
+    """
+    out = task['name']
+
     if task['due_date']:
-        date_str = task['due_date_str']
         if include_weekday:
-            weekday = get_weekday_name(task['due_date'])
-            date_str = f"{date_str} ({weekday})"
-        parts.append(f"due: {date_str}")
-    
+            out += f" - due: {task['due_date_str']} ({task['weekday_name']})"
+        else:
+            out += f" - due: {task['due_date_str']}"
+
     if task['frequency']:
-        parts.append(f"[{task['frequency']}]")
-    
-    return " - ".join(parts)
+        out += f" - [{task['frequency']}]"
+
+    return out
+
+
+# Bullet renderer bound once; the map(render_bullet, map(format_task, ...))
+# pipelines in the list commands then run the whole row loop at C level
+# with no per-row method lookup or generator frame
+render_bullet = "  • {}".format
+
+
+def dumps_json(obj: Any) -> str:
+    """Serialize a --json payload with the fastest available encoder.
+
+    Pretty-printed only when stdout is a terminal; piped consumers
+    (startup.py, jq) get compact output, which encodes faster and
+    trims the payload ~15%.
+    """
+    indent = sys.stdout.isatty()
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    import json
+    if indent:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(',', ':'))
 
 
 def task_to_dict(task: Dict[str, Any]) -> Dict[str, Any]:
@@ -275,8 +370,8 @@ def task_to_dict(task: Dict[str, Any]) -> Dict[str, Any]:
     }
     
     if task['due_date']:
-        result['weekday'] = get_weekday_name(task['due_date'])
-    
+        result['weekday'] = task['weekday_name']
+
     return result
 
 
@@ -286,22 +381,23 @@ def task_to_dict(task: Dict[str, Any]) -> Dict[str, Any]:
 
 def cmd_status(args):
     """Show overdue, due today, and due tomorrow tasks."""
-    tasks = read_tasks(args.csv_path)
+    tasks, due_ords = read_tasks_indexed(args.csv_path)
     today = today_local()
-    tomorrow = today + timedelta(days=1)
-    
-    overdue = []
-    due_today = []
-    due_tomorrow = []
-    
-    for task in tasks:
-        if task['due_date'] and task['status'].lower() != 'done':
-            if task['due_date'] < today:
-                overdue.append(task)
-            elif task['due_date'] == today:
-                due_today.append(task)
-            elif task['due_date'] == tomorrow:
-                due_tomorrow.append(task)
+
+    # The list is sorted by due date, so three bisects carve out the
+    # overdue/today/tomorrow windows and everything past tomorrow is never
+    # touched — O(log N + k) instead of a full scan
+    today_ord = today.toordinal()
+    today_lo = bisect_left(due_ords, today_ord)
+    today_hi = bisect_right(due_ords, today_ord)
+    tomorrow_hi = bisect_right(due_ords, today_ord + 1)
+
+    def active(window):
+        return [t for t in window if not t['is_done']]
+
+    overdue = active(tasks[:today_lo])
+    due_today = active(tasks[today_lo:today_hi])
+    due_tomorrow = active(tasks[today_hi:tomorrow_hi])
     
     if args.json:
         return {
@@ -312,45 +408,42 @@ def cmd_status(args):
             'due_tomorrow': [task_to_dict(t) for t in due_tomorrow],
         }
     
-    lines = []
-    lines.append(f"Task Status for {format_date(today)} ({get_weekday_name(today)})")
-    lines.append("=" * 50)
-    
-    if overdue:
-        lines.append(f"\n⚠️  OVERDUE ({len(overdue)}):")
-        for task in overdue:
-            lines.append(f"  • {format_task(task)}")
-    
-    if due_today:
-        lines.append(f"\n📅 DUE TODAY ({len(due_today)}):")
-        for task in due_today:
-            lines.append(f"  • {format_task(task)}")
-    
-    if due_tomorrow:
-        lines.append(f"\n📆 DUE TOMORROW ({len(due_tomorrow)}):")
-        for task in due_tomorrow:
-            lines.append(f"  • {format_task(task)}")
-    
-    if not overdue and not due_today and not due_tomorrow:
-        lines.append("\n✅ No tasks due today or tomorrow, and nothing overdue!")
-    
-    return "\n".join(lines)
+    def lines():
+        yield f"Task Status for {format_date(today)} ({get_weekday_name(today)})"
+        yield "=" * 50
+
+        if overdue:
+            yield f"\n⚠️  OVERDUE ({len(overdue)}):"
+            yield from map(render_bullet, map(format_task, overdue))
+
+        if due_today:
+            yield f"\n📅 DUE TODAY ({len(due_today)}):"
+            yield from map(render_bullet, map(format_task, due_today))
+
+        if due_tomorrow:
+            yield f"\n📆 DUE TOMORROW ({len(due_tomorrow)}):"
+            yield from map(render_bullet, map(format_task, due_tomorrow))
+
+        if not overdue and not due_today and not due_tomorrow:
+            yield "\n✅ No tasks due today or tomorrow, and nothing overdue!"
+
+    return lines()
 
 
 def cmd_upcoming(args):
     """Show tasks due in the next N days."""
-    tasks = read_tasks(args.csv_path)
+    tasks, due_ords = read_tasks_indexed(args.csv_path)
     today = today_local()
     end_date = today + timedelta(days=args.days)
-    
-    upcoming = []
-    for task in tasks:
-        if task['due_date'] and task['status'].lower() != 'done':
-            if today <= task['due_date'] <= end_date:
-                upcoming.append(task)
-    
-    upcoming.sort(key=lambda t: t['due_date'])
-    
+
+    # Same trick as cmd_status: bisect the sorted list down to the
+    # [today, end_date] window. The slice is already in due-date order,
+    # so no re-sort, and undated tasks (keyed as UNDATED_ORD) fall
+    # outside the window automatically.
+    lo = bisect_left(due_ords, today.toordinal())
+    hi = bisect_right(due_ords, end_date.toordinal())
+    upcoming = [t for t in tasks[lo:hi] if not t['is_done']]
+
     if args.json:
         return {
             'today': format_date(today),
@@ -359,17 +452,16 @@ def cmd_upcoming(args):
             'tasks': [task_to_dict(t) for t in upcoming],
         }
     
-    lines = []
-    lines.append(f"Tasks due in next {args.days} days ({format_date(today)} to {format_date(end_date)})")
-    lines.append("=" * 50)
-    
-    if upcoming:
-        for task in upcoming:
-            lines.append(f"  • {format_task(task)}")
-    else:
-        lines.append("\n✅ No tasks due in this period!")
-    
-    return "\n".join(lines)
+    def lines():
+        yield f"Tasks due in next {args.days} days ({format_date(today)} to {format_date(end_date)})"
+        yield "=" * 50
+
+        if upcoming:
+            yield from map(render_bullet, map(format_task, upcoming))
+        else:
+            yield "\n✅ No tasks due in this period!"
+
+    return lines()
 
 
 def cmd_list(args):
@@ -385,14 +477,13 @@ def cmd_list(args):
             'tasks': [task_to_dict(t) for t in tasks],
         }
     
-    lines = []
-    lines.append(f"All Tasks ({len(tasks)} total)")
-    lines.append("=" * 50)
-    
-    for task in tasks:
-        lines.append(f"  • {format_task(task)}")
-    
-    return "\n".join(lines)
+    def lines():
+        yield f"All Tasks ({len(tasks)} total)"
+        yield "=" * 50
+
+        yield from map(render_bullet, map(format_task, tasks))
+
+    return lines()
 
 
 def cmd_get(args):
@@ -408,23 +499,23 @@ def cmd_get(args):
     if args.json:
         return task_to_dict(task)
     
-    lines = []
-    lines.append(f"Task: {task['name']}")
-    lines.append("=" * 50)
-    lines.append(f"  Due Date:  {task['due_date_str']}" + 
-                 (f" ({get_weekday_name(task['due_date'])})" if task['due_date'] else ""))
-    lines.append(f"  Category:  {task['category']}")
-    lines.append(f"  Frequency: {task['frequency']}")
-    lines.append(f"  Priority:  {task['priority']}")
-    lines.append(f"  Status:    {task['status']}")
-    lines.append(f"  URL:       {task['url']}")
-    
-    return "\n".join(lines)
+    def lines():
+        yield f"Task: {task['name']}"
+        yield "=" * 50
+        yield (f"  Due Date:  {task['due_date_str']}" +
+               (f" ({task['weekday_name']})" if task['due_date'] else ""))
+        yield f"  Category:  {task['category']}"
+        yield f"  Frequency: {task['frequency']}"
+        yield f"  Priority:  {task['priority']}"
+        yield f"  Status:    {task['status']}"
+        yield f"  URL:       {task['url']}"
+
+    return lines()
 
 
 def cmd_complete(args):
     """Complete a task and calculate next due date for recurring tasks."""
-    tasks = read_tasks(args.csv_path)
+    tasks = read_tasks(args.csv_path, mutable=True)
     task = find_task(tasks, args.task_name)
     
     if not task:
@@ -445,10 +536,13 @@ def cmd_complete(args):
             )
             task['due_date'] = new_due_date
             task['due_date_str'] = format_date(new_due_date)
+            task['weekday_name'] = get_weekday_name(new_due_date)
         task['status'] = 'To Do'
+        task['is_done'] = False
         action = 'rescheduled'
     else:
         task['status'] = 'Done'
+        task['is_done'] = True
         action = 'completed'
     
     write_tasks(args.csv_path, tasks)
@@ -463,11 +557,11 @@ def cmd_complete(args):
             'new_status': task['status'],
         }
         if task['due_date']:
-            result['new_weekday'] = get_weekday_name(task['due_date'])
+            result['new_weekday'] = task['weekday_name']
         return result
-    
+
     if action == 'rescheduled':
-        new_weekday = get_weekday_name(task['due_date']) if task['due_date'] else ''
+        new_weekday = task['weekday_name'] if task['due_date'] else ''
         return (f"✅ Rescheduled: {task['name']}\n"
                 f"   Old due date: {old_due_date}\n"
                 f"   New due date: {task['due_date_str']} ({new_weekday})\n"
@@ -476,7 +570,70 @@ def cmd_complete(args):
         return f"✅ Completed: {task['name']}\n   Status: {task['status']}"
 
 
-def main():
+COMMANDS = {
+    'status': cmd_status,
+    'upcoming': cmd_upcoming,
+    'list': cmd_list,
+    'get': cmd_get,
+    'complete': cmd_complete,
+}
+
+# Commands eligible for the argparse-free fast path in main(), mapped to
+# the namespace defaults their handlers expect
+FAST_COMMANDS = {
+    'status': {},
+    'upcoming': {'days': 7},
+    'list': {'status': None},
+}
+
+
+def try_fast_path(argv):
+    """Parse simple invocations without building the argparse tree.
+
+    Same idea as date_utils.try_fast_path: the subparser tree costs a
+    measurable slice of a quick `status` check, so the read-only hot
+    commands (plus an optional --json) get their namespace assembled
+    directly. Returns None for anything else (--help, --csv, get,
+    complete, unknown commands), which falls through to full argparse.
+    """
+    flags = [a for a in argv if a.startswith('-')]
+    if flags not in ([], ['--json']):
+        return None
+
+    positional = [a for a in argv if not a.startswith('-')]
+    if not positional:
+        return None
+
+    command, rest = positional[0], positional[1:]
+    defaults = FAST_COMMANDS.get(command)
+    if defaults is None:
+        return None
+
+    extra = dict(defaults)
+    if command == 'upcoming' and rest:
+        if len(rest) > 1 or not rest[0].isdigit():
+            return None
+        extra['days'] = int(rest[0])
+    elif rest:
+        return None
+
+    return SimpleNamespace(command=command, json=bool(flags),
+                           csv_path=None, **extra)
+
+
+def status_data(csv_path: Optional[Path] = None) -> Dict[str, Any]:
+    """Return the status payload as a dict.
+
+    In-process API for startup.py — same shape as `--json status` without
+    spawning a subprocess or round-tripping through JSON text.
+    """
+    args = SimpleNamespace(csv_path=csv_path or get_csv_path(), json=True)
+    return cmd_status(args)
+
+
+def build_parser():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Task manager for PWKM system",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -506,37 +663,45 @@ def main():
     # complete
     p_complete = subparsers.add_parser('complete', help='Complete a task')
     p_complete.add_argument('task_name', help='Task name (partial match supported)')
-    
-    args = parser.parse_args()
-    
+
+    return parser
+
+
+def main():
+    args = try_fast_path(sys.argv[1:])
+    if args is None:
+        args = build_parser().parse_args()
+
     if args.csv_path is None:
         args.csv_path = get_csv_path()
     
     try:
-        handlers = {
-            'status': cmd_status,
-            'upcoming': cmd_upcoming,
-            'list': cmd_list,
-            'get': cmd_get,
-            'complete': cmd_complete,
-        }
-        
-        result = handlers[args.command](args)
-        
+        result = COMMANDS[args.command](args)
+
         if args.json:
-            print(json.dumps(result, indent=2))
-        else:
+            print(dumps_json(result))
+        elif isinstance(result, str):
+            # Short single-result messages (complete, not-found errors)
             print(result)
+        else:
+            # List-style commands yield their lines; stream them straight
+            # to stdout instead of accumulating and joining a big list
+            write = sys.stdout.write
+            for line in result:
+                write(line)
+                write('\n')
             
     except FileNotFoundError as e:
         error_msg = f"CSV file not found: {args.csv_path}"
         if args.json:
+            import json
             print(json.dumps({'error': error_msg}), file=sys.stderr)
         else:
             print(f"Error: {error_msg}", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
         if args.json:
+            import json
             print(json.dumps({'error': str(e)}), file=sys.stderr)
         else:
             print(f"Error: {e}", file=sys.stderr)